@@ -1,3 +1,3 @@
-from decorators import defer, asyncFunc
-from events import EventEmitter
-import process
+from .decorators import defer, asyncFunc
+from .events import EventEmitter
+from . import process
@@ -1,29 +1,53 @@
 from .compat import Object
 
 
+class CallHandle(Object):
+    """Returned by `process.callSoon` and `process.callImmediately`; holds nothing but the flag used to cancel the call.
+
+    """
+    __slots__ = ('canceled', '__weakref__')
+
+    def __init__(self):
+        self.canceled = False
+
+    def cancel(self):
+        """Cancels the call, so it will no longer be made.
+
+        """
+        self.canceled = True
+
+
 class Callback(Object):
-    def __init__(self, func=None, args=[], kwargs={}, after=None):
+    __slots__ = ('func', 'args', 'kwargs', 'after', 'canceled', 'onCanceled', '__weakref__')
+
+    def __init__(self, func=None, args=None, kwargs=None, after=None):
         self.func = func
         self.args = args
         self.kwargs = kwargs
         self.after = after
-        self._canceled = False
+        self.canceled = False
         self.onCanceled = None
 
-    @property
-    def canceled(self):
-        return self._canceled
+    def cancel(self):
+        """Cancels the callback, so it will no longer be called, and notifies `onCanceled`, if set.
 
-    @canceled.setter
-    def canceled(self, value):
-        self.canceled = value
+        """
+        self.canceled = True
 
-        if(value and self.onCanceled):
-            self.onCanceled(value)
+        onCanceled = self.onCanceled
+        if onCanceled:
+            onCanceled(True)
 
     def __call__(self, *_args):
         if not self.canceled:
-            self.func(*self.args, **self.kwargs)
+            # `args` and `kwargs` may be `None`; only unpack what we were actually given.
+            args, kwargs = self.args, self.kwargs
+            if kwargs:
+                self.func(*(args or ()), **kwargs)
+            elif args:
+                self.func(*args)
+            else:
+                self.func()
 
             if self.after:
                 self.after()
@@ -1 +1,2 @@
-from .object import Object
\ No newline at end of file
+from .object import Object
+from .strings import intern
\ No newline at end of file
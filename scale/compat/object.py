@@ -9,7 +9,7 @@ if sys.version_info[0] < 3:
         A default "base" object simplifying Python 2 and Python 3
         compatibility. Ensures a 'new-style' class on Python 2.
         """
-        pass
+        __slots__ = ()
 else:
 
     # Python 3
@@ -18,4 +18,4 @@ else:
         A default "base" object simplifying Python 2 and Python 3
         compatibility. Ensures a 'new-style' class on Python 2.
         """
-        pass
\ No newline at end of file
+        __slots__ = ()
\ No newline at end of file
@@ -0,0 +1,11 @@
+import sys
+
+# Check for Python 2
+if sys.version_info[0] < 3:
+
+    # Python 2
+    intern = intern
+else:
+
+    # Python 3
+    from sys import intern
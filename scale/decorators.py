@@ -1,6 +1,6 @@
 from functools import partial
 
-import process
+from . import process
 
 
 def defer(func):
@@ -34,8 +34,15 @@ def asyncFunc(func):
         // prints out "Message: Welcome, traveler!"
 
     """
-    func.async = lambda *a, **kw: (lambda cb: func.sync(*a, **kw)(defer(cb)))
-    func.sync = lambda *a, **kw: partial(partial, func)(*a, **kw)
+    def asyncCall(*a, **kw):
+        def bind(cb):
+            return func(*(a + (partial(process.callSoon, cb),)), **kw)
+
+        return bind
+
+    # `async` is a keyword on Python 3.7+, so it can only be set (or read) with setattr/getattr there.
+    setattr(func, 'async', asyncCall)
+    func.sync = lambda *a, **kw: partial(func, *a, **kw)
 
     return func
 
@@ -3,7 +3,7 @@ from functools import partial
 from collections import defaultdict
 
 # local imports
-from .compat import Object
+from .compat import Object, intern
 from .decorators import defer as build_deferred
 from .utils import isNumber, isNan
 
@@ -11,6 +11,40 @@ from .utils import isNumber, isNan
 logger = logging.getLogger('EventEmitter')
 
 
+def _noop(args, kwargs):
+    return False
+
+
+def _unhandledError(args, kwargs):
+    # Like node, rethrow the emitted error if it is one.
+    if args and isinstance(args[0], BaseException):
+        raise args[0]
+
+    raise RuntimeError('Uncaught, unspecified "error" event.')
+
+
+class _OnceListener(Object):
+    """Wraps a listener registered with `EventEmitter.once`, removing it from the emitter the first time it fires. The
+    original listener is available as `listener`, like node's once wrappers.
+
+    """
+    __slots__ = ('emitter', 'event', 'listener', 'fired')
+
+    def __init__(self, emitter, event, listener):
+        self.emitter = emitter
+        self.event = event
+        self.listener = listener
+        self.fired = False
+
+    def __call__(self, *args, **kwargs):
+        if self.fired:
+            return
+
+        self.fired = True
+        self.emitter.removeListener(self.event, self)
+        self.listener(*args, **kwargs)
+
+
 class EventEmitter(Object):
     """A port of node.js's EventEmitter class. Built to work with the rest of the async framework by default. From
     node's documentation:
@@ -22,11 +56,13 @@ class EventEmitter(Object):
     _listeners_.
 
     """
+    __slots__ = ('_events', '_warned', '_maxListeners', '_dispatchCache', '__weakref__')
 
     def __init__(self):
-        self._events = defaultdict(set)
-        self._warned = list()
+        self._events = defaultdict(list)
+        self._warned = set()
         self._maxListeners = 10
+        self._dispatchCache = {}
 
     def addListener(self, event, listener):
         """Adds a listener to the end of the listeners array for the specified event.
@@ -35,20 +71,27 @@ class EventEmitter(Object):
         if not callable(listener):
             raise TypeError('listener must be callable')
 
-        # Avoid recursion in the case that event == "newListener".
-        if self._events['newListener']:
-            self.emit('newListener', event, listener.listener if callable(listener.listener) else listener)
+        # Intern event names, so looking them up by a literal (which Python interns for us) can match on identity.
+        if type(event) is str:
+            event = intern(event)
 
-        # Since events is a default dict, we can always simply add the new listener
-        self._events[event].add(listener)
+        # Avoid recursion in the case that event == "newListener". Use `get`, so we don't store an empty list for
+        # 'newListener' on every call.
+        if self._events.get('newListener'):
+            self.emit('newListener', event, getattr(listener, 'listener', listener))
 
-        # Detect event emitter leaks
-        if event not in self._warned:
-            if 1 < self._maxListeners < len(self._events[event]):
+        # Since events is a default dict, we can always simply append the new listener
+        self._events[event].append(listener)
+        self._dispatchCache.pop(event, None)
+
+        # Detect event emitter leaks; once we've warned about an event, we don't bother counting its listeners again.
+        if self._maxListeners and event not in self._warned:
+            count = len(self._events[event])
+            if count > self._maxListeners:
                 logger.warning(("Possible EventEmitter memory leak detected. {} listeners added. " +
-                                "Use emitter.setMaxListeners() to increase limit.").format(len(self._events[event])))
+                                "Use emitter.setMaxListeners() to increase limit.").format(count))
 
-                self._warned.add('event')
+                self._warned.add(event)
 
                 #TODO: print a trace?
 
@@ -77,42 +120,40 @@ class EventEmitter(Object):
         after which it is removed.
 
         """
-        def fireOnce():
-            self.removeListener(event, fireOnce)
-            listener()
-
-        self.addListener(event, fireOnce)
+        self.addListener(event, _OnceListener(self, event, listener))
 
     def removeAllListeners(self, event=None):
-        """Removes all listeners for the event.
+        """Removes all listeners, or those of the specified event.
 
         """
-        # Check to see if we need to bother emitting 'removeListener'
-        if 'removeListener' not in self._events:
-            if event:
-                if event not in self._events:
-                    return
-                else:
-                    del self._events[event]
-            else:
-                # Remove all event listeners
-                self._events = {}
-        else:
-            if event:
-                if event not in self._events:
-                    return
-                else:
-                    for listener in self._events[event]:
-                        self.removeListener(event, listener)
-            else:
-                # Remove all event listeners
-                for event in self._events.keys():
-                    if event != 'removeListener':
-                        for listener in self._events[event]:
-                            self.removeListener(event, listener)
-
-                # Make sure to clear out the 'removeListener' listeners, too.
-                self._events = {}
+        events = self._events
+
+        if event is None:
+            # Only bother emitting 'removeListener' if someone is listening for it.
+            if events.get('removeListener'):
+                emit = self.emit
+                for name in [name for name in events if name != 'removeListener']:
+                    # A 'removeListener' listener may already have emptied (and so deleted) this bucket.
+                    listeners = events.pop(name, None)
+                    self._dispatchCache.pop(name, None)
+                    if not listeners:
+                        continue
+
+                    for listener in listeners:
+                        emit('removeListener', name, getattr(listener, 'listener', listener))
+
+            # Make sure to clear out the 'removeListener' listeners, too.
+            events.clear()
+            self._dispatchCache.clear()
+            return
+
+        listeners = events.pop(event, None)
+        self._dispatchCache.pop(event, None)
+
+        if listeners and events.get('removeListener'):
+            emit = self.emit
+            for listener in listeners:
+                emit('removeListener', event, getattr(listener, 'listener', listener))
 
     def removeListener(self, event, listener):
         """Removes all listeners, or those of the specified event.
@@ -122,9 +163,27 @@ class EventEmitter(Object):
         if not callable(listener):
             raise TypeError('listener must be callable')
 
-        if event in self._events:
-            self._events[event].remove(listener)
-            self.emit('removeListener', event, listener)
+        listeners = self._events.get(event)
+        if listeners is None:
+            return
+
+        # Search from the end, like node; a `once` listener can be removed either by its wrapper, or by the function
+        # that was passed to `once`.
+        for index in range(len(listeners) - 1, -1, -1):
+            registered = listeners[index]
+            if registered == listener or getattr(registered, 'listener', None) == listener:
+                break
+        else:
+            # Like node, removing a listener that isn't registered (for example, one an in-flight `emit` is still going
+            # to call, after it was removed) does nothing.
+            return
+
+        del listeners[index]
+        if not listeners:
+            del self._events[event]
+
+        self._dispatchCache.pop(event, None)
+        self.emit('removeListener', event, getattr(registered, 'listener', registered))
 
     def setMaxListeners(self, num):
         """By default EventEmitters will print a warning if more than 10 listeners are added for a particular event.
@@ -132,19 +191,23 @@ class EventEmitter(Object):
         This function allows that to be increased. Set to zero for unlimited.
 
         """
-        if not isNumber(num) or num < 0 or isNan(num):
+        # Fast path for the usual case of an int
+        if isinstance(num, int):
+            if num < 0:
+                raise TypeError('num must be a positive number.')
+            self._maxListeners = num
+            return self
+
+        if not isNumber(num) or isNan(float(num)) or num < 0:
             raise TypeError('num must be a positive number.')
         self._maxListeners = num
         return self
 
     def listeners(self, event):
-        """Returns an array of listeners for the specified event.
+        """Returns a copy of the array of listeners for the specified event.
 
         """
-        if event in self._events:
-            return self._events[event]
-
-        return []
+        return list(self._events.get(event, ()))
 
     def emit(self, event, *args, **kwargs):
         """Execute each of the listeners in order with the supplied arguments.
@@ -152,11 +215,47 @@ class EventEmitter(Object):
         Returns `True` if event had listeners, `False` otherwise.
 
         """
-        if event == 'error' and len(self._events[event]) > 0:
-            raise RuntimeError('Uncaught, unspecified "error" event.')
+        dispatch = self._dispatchCache.get(event)
+        if dispatch is None:
+            dispatch = self._buildDispatch(event)
+
+        return dispatch(args, kwargs)
+
+    def _buildDispatch(self, event):
+        """Builds the function `emit` uses to call the listeners for `event`, specialized for the number of listeners.
+        The result is cached until the listeners for `event` change, and always calls the listeners registered when it
+        was built, like node does.
 
-        for listener in self._events[event]:
-            listener(*args, **kwargs)
+        """
+        listeners = self._events.get(event)
+
+        # Not cached, so emitting events nobody listens for doesn't grow the cache.
+        if not listeners:
+            return _unhandledError if event == 'error' else _noop
+
+        if type(event) is str:
+            event = intern(event)
+
+        if len(listeners) == 1:
+            listener = listeners[0]
+
+            def dispatch(args, kwargs):
+                listener(*args, **kwargs)
+                return True
+
+        else:
+            # Snapshot the listeners. Adding or removing a listener invalidates this dispatcher rather than modifying
+            # what it iterates, so a listener that removes itself (`once`) can't make us skip the next one, and we
+            # only copy the list when it changes instead of on every emit.
+            listeners = tuple(listeners)
+
+            def dispatch(args, kwargs):
+                for listener in listeners:
+                    listener(*args, **kwargs)
+                return True
+
+        self._dispatchCache[event] = dispatch
+        return dispatch
 
     @classmethod
     def listenerCount(cls, emitter, event):
@@ -3,22 +3,56 @@ import logging
 import collections
 import signal
 import socket
+from functools import partial
 
 import pyuv
 
-from .callback import Callback
+from .callback import Callback, CallHandle
 
 
-def _processCallback(callback):
-    """Call the callback, and handle exceptions
+# Callers for queued functions, one per argument shape; picking one at schedule time means a call with no arguments
+# never has to unpack anything.
+def _call(func, args, kwargs):
+    func()
+
+
+def _callArgs(func, args, kwargs):
+    func(*args)
+
+
+def _callKwargs(func, args, kwargs):
+    func(**kwargs)
+
+
+def _callArgsKwargs(func, args, kwargs):
+    func(*args, **kwargs)
+
+
+def _processCallbackFast(item):
+    """Call the scheduled function. `item` is a `(call, func, args, kwargs, handle)` tuple, as queued by
+    `callImmediately` and `callSoon`. Exceptions propagate to the loop's excepthook; see `enableExceptionCapture`.
+
+    """
+    call, func, args, kwargs, handle = item
+    if not handle.canceled:
+        call(func, args, kwargs)
+
+
+def _processCallbackChecked(item):
+    """Call the scheduled function, and handle exceptions. `item` is a `(call, func, args, kwargs, handle)`
+    tuple, as queued by `callImmediately` and `callSoon`.
 
     """
     global _last_exc
 
+    call, func, args, kwargs, handle = item
+    if handle.canceled:
+        return
+
     try:
-        callback()
+        call(func, args, kwargs)
     except Exception:
-        logging.exception('Exception in callback %s %r %r', callback.func, callback.args, callback.kwargs)
+        logging.exception('Exception in callback %s %r %r', func, args, kwargs)
     except BaseException:
         _last_exc = sys.exc_info()
 
@@ -27,11 +61,22 @@ def _processImmediates():
     """Run through all immediates, and (assuming we've run less than `immediateLimit`) and call them.
 
     """
-    global _immediates, _immediatesCalled, immediateLimit
+    global _immediatesCalled
+
+    # Bind everything the loop touches to locals; the counter is written back once we're done, even if a callback
+    # raises.
+    immediates = _immediates
+    popleft = immediates.popleft
+    process = _processCallback
+    limit = immediateLimit - _immediatesCalled
 
-    while _immediates and _immediatesCalled < immediateLimit:
-        _immediatesCalled += 1
-        _processCallback(_immediates.popleft())
+    called = 0
+    try:
+        while called < limit and immediates:
+            called += 1
+            process(popleft())
+    finally:
+        _immediatesCalled += called
 
 
 def _processDeferreds(handle):
@@ -42,16 +87,27 @@ def _processDeferreds(handle):
     execution.
 
     """
-    global _loop, _deferreds, _last_exc, _deferredsHandle, _immediatesCalled
+    global _immediatesCalled
 
     _immediatesCalled = 0
-    deferredsScheduled = bool(_deferreds)
 
-    while _deferreds:
-        _processCallback(_deferreds.popleft())
+    deferreds = _deferreds
+    if not deferreds:
+        return
 
-    if deferredsScheduled and not _deferreds:
-        _deferredsHandle.unref()
+    popleft = deferreds.popleft
+    process = _processCallback
+    processImmediates = _processImmediates
+
+    try:
+        while deferreds:
+            process(popleft())
+            processImmediates()
+    finally:
+        # A callback that raises leaves the loop early; only let go of the handle once the queue has been drained, or
+        # the loop would either exit with deferreds pending, or never exit at all.
+        if not deferreds:
+            _deferredsHandle.unref()
 
 
 def _tick():
@@ -74,12 +130,20 @@ def _tick():
 
 
 def _exceptHook(typ, val, tb):
-    """Handle exceptions, closing the application on KeyboardInterrupt.
+    """Handle exceptions, closing the application on KeyboardInterrupt. Other exceptions are logged, and anything else
+    (`SystemExit`, etc.) is re-raised on the next tick.
 
     """
+    global _last_exc
+
     if typ is KeyboardInterrupt:
-        signal_checker.stop()
+        if signal_checker is not None:
+            signal_checker.stop()
         _close()
+    elif issubclass(typ, Exception):
+        logging.error('Exception in callback', exc_info=(typ, val, tb))
+    else:
+        _last_exc = (typ, val, tb)
 
 
 def _close():
@@ -105,6 +169,27 @@ def _close():
     _loop = None
 
 
+def _ensureSignals():
+    """Sets up the signal wakeup fd and the checker that watches it. This is done the first time the loop runs, rather
+    than on import, so importing this module doesn't allocate a socket pair or take over `signal.set_wakeup_fd`.
+
+    """
+    global _signalsReady, reader, writer, signal_checker
+
+    if _signalsReady:
+        return
+
+    reader, writer = socket.socketpair()
+    reader.setblocking(False)
+    writer.setblocking(False)
+
+    signal.set_wakeup_fd(writer.fileno())
+    signal_checker = pyuv.util.SignalChecker(_loop, reader.fileno())
+    signal_checker.start()
+
+    _signalsReady = True
+
+
 #-----------------------------------------------------------------------------------------------------------------------
 # Scheduling
 #-----------------------------------------------------------------------------------------------------------------------
@@ -114,27 +199,39 @@ def callImmediately(func, *args, **kwargs):
     """Schedules the function to be called immediately after the current one finishes executing. This means it will be
     scheduled **before** all other events currently in the event queue. Equivalent to node.js' `process.nextTick`.
 
+    Returns a `CallHandle` that can be used to cancel the call.
+
     """
-    callback = Callback(func, args, kwargs)
-    callback.after = _processImmediates
-    _immediates.append(callback)
+    if kwargs:
+        call = _callArgsKwargs if args else _callKwargs
+    else:
+        call = _callArgs if args else _call
 
-    return callback
+    handle = CallHandle()
+    _immediates.append((call, func, args, kwargs, handle))
+
+    return handle
 
 
 def callSoon(func, *args, **kwargs):
     """Schedules the function to be called after the current tick finishes. This means it will be scheduled **after**
     any events currently in the event queue. Equivalent to node.js' `setImmediate`.
 
+    Returns a `CallHandle` that can be used to cancel the call.
+
     """
     if not _deferreds:
         _deferredsHandle.ref()
 
-    callback = Callback(func, args, kwargs)
-    callback.after = _processImmediates
-    _deferreds.append(callback)
+    if kwargs:
+        call = _callArgsKwargs if args else _callKwargs
+    else:
+        call = _callArgs if args else _call
 
-    return callback
+    handle = CallHandle()
+    _deferreds.append((call, func, args, kwargs, handle))
+
+    return handle
 
 
 def setTimeout(func, delay, *args, **kwargs):
@@ -146,7 +243,8 @@ def setTimeout(func, delay, *args, **kwargs):
     if delay < 0:
         raise ValueError('invalid delay specified: {}'.format(delay))
     elif delay == 0:
-        callSoon(func, args, kwargs)
+        # Nothing to wait for, so skip the libuv timer.
+        return callSoon(func, *args, **kwargs)
 
     timer = pyuv.Timer(_loop)
 
@@ -154,13 +252,19 @@ def setTimeout(func, delay, *args, **kwargs):
         _timers.remove(timer)
         _processImmediates()
 
+    def timerCanceled(canceled):
+        if timer in _timers:
+            timer.close()
+            _timers.remove(timer)
+
     callback = Callback(func, args, kwargs)
     callback.after = timerCleanup
+    callback.onCanceled = timerCanceled
 
     timer.handler = callback
     timer.start(callback, delay, 0)
 
-    _timers.append(timer)
+    _timers.add(timer)
 
     return callback
 
@@ -174,17 +278,23 @@ def setInterval(func, interval, *args, **kwargs):
 
     timer = pyuv.Timer(_loop)
 
-    def timerCleanup():
-        _timers.remove(timer)
+    def timerCleanup(canceled):
+        if timer in _timers:
+            timer.close()
+            _timers.remove(timer)
 
-    callback = Callback(func, args, kwargs)
+    # Bind the arguments once, rather than unpacking them every time the timer fires.
+    if args or kwargs:
+        func = partial(func, *args, **kwargs)
+
+    callback = Callback(func)
     callback.after = _processImmediates
     callback.onCanceled = timerCleanup
 
     timer.handler = callback
     timer.start(callback, interval, interval)
 
-    _timers.append(timer)
+    _timers.add(timer)
 
     return callback
 
@@ -193,6 +303,8 @@ def setInterval(func, interval, *args, **kwargs):
 
 
 def run():
+    _ensureSignals()
+
     while _tick() and not _stop:
         pass
 
@@ -201,11 +313,11 @@ def runForever():
     """Starts the event loop and runs it forever.
 
     """
-    callback = setInterval(24*3600, lambda: None)
+    callback = setInterval(lambda: None, 24*3600)
     try:
         run()
     finally:
-        callback.cancel = True
+        callback.cancel()
 
 
 def runOnce(timeout=None):
@@ -218,6 +330,7 @@ def runOnce(timeout=None):
         timer.start(lambda x: None, timeout, 0)
 
     # Run through the loop once
+    _ensureSignals()
     _tick()
 
     # If we created a timer, close it
@@ -254,6 +367,17 @@ def exit(code=0):
     sys.exit(code)
 
 
+def enableExceptionCapture():
+    """Wraps every queued callback in its own exception handler, logging exceptions along with the function and
+    arguments that raised them. Without this, exceptions are handled by the loop's excepthook, which knows nothing about
+    the callback that raised them. Useful when debugging.
+
+    """
+    global _processCallback
+
+    _processCallback = _processCallbackChecked
+
+
 #-----------------------------------------------------------------------------------------------------------------------
 
 
@@ -263,9 +387,12 @@ _loop = pyuv.Loop.default_loop()
 _stop = False
 _last_exc = None
 
+# Callbacks run without a try/except of their own unless exception capture is enabled.
+_processCallback = _processCallbackFast
+
 _immediates = collections.deque()
 _deferreds = collections.deque()
-_timers = collections.deque()
+_timers = set()
 
 immediateLimit = 10
 _immediatesCalled = 0
@@ -276,15 +403,11 @@ _waker.unref()
 _deferredsHandle = pyuv.Check(_loop)
 _deferredsHandle.start(_processDeferreds)
 
-# Signal handling
-reader, writer = socket.socketpair()
-reader.setblocking(False)
-writer.setblocking(False)
-
 _loop.excepthook = _exceptHook
 
-signal.set_wakeup_fd(writer.fileno())
-signal_checker = pyuv.util.SignalChecker(_loop, reader.fileno())
-signal_checker.start()
+# Signal handling; set up by `_ensureSignals` the first time the loop runs.
+_signalsReady = False
+reader = writer = None
+signal_checker = None
 
 #-----------------------------------------------------------------------------------------------------------------------
@@ -1,5 +1,5 @@
 from .events import EventEmitter
-import process
+from .process import setInterval as _setInterval, setTimeout as _setTimeout
 
 
 class Timer(EventEmitter):
@@ -20,9 +20,9 @@ class Timer(EventEmitter):
 
         """
         if self.repeating:
-            self._callback = process.setInterval(self._timeout, self.delay)
+            self._callback = _setInterval(self._timeout, self.delay)
         else:
-            self._callback = process.setTimeout(self._timeout, self.delay)
+            self._callback = _setTimeout(self._timeout, self.delay)
 
         self.emit('started')
 
@@ -30,7 +30,7 @@ class Timer(EventEmitter):
         """Stops the timer. Emits the 'stopped' signal.
 
         """
-        self._callback.cancel = True
+        self._callback.cancel()
         self.emit('stopped')
 
     def _timeout(self):
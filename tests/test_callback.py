@@ -0,0 +1,39 @@
+import unittest
+
+from scale.callback import Callback, CallHandle
+
+
+class TestCallback(unittest.TestCase):
+    def test_cancel(self):
+        calls = []
+        notified = []
+
+        callback = Callback(calls.append, ('called',))
+        callback.onCanceled = notified.append
+        callback.cancel()
+        callback()
+
+        self.assertTrue(callback.canceled)
+        self.assertEqual(calls, [])
+        self.assertEqual(notified, [True])
+
+    def test_call(self):
+        calls = []
+
+        Callback(lambda *args, **kwargs: calls.append((args, kwargs)))()
+        Callback(lambda *args, **kwargs: calls.append((args, kwargs)), (1,), {'key': 'value'})()
+
+        self.assertEqual(calls, [((), {}), ((1,), {'key': 'value'})])
+
+
+class TestCallHandle(unittest.TestCase):
+    def test_cancel(self):
+        handle = CallHandle()
+        self.assertFalse(handle.canceled)
+
+        handle.cancel()
+        self.assertTrue(handle.canceled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import logging
+import unittest
+import weakref
+from contextlib import contextmanager
+
+from scale.events import EventEmitter
+
+
+@contextmanager
+def warnLogged():
+    """Collects the messages the 'EventEmitter' logger emits inside the block.
+
+    """
+    messages = []
+
+    class Handler(logging.Handler):
+        def emit(self, record):
+            messages.append(record.getMessage())
+
+    handler = Handler(logging.WARNING)
+    logger = logging.getLogger('EventEmitter')
+    logger.addHandler(handler)
+    try:
+        yield messages
+    finally:
+        logger.removeHandler(handler)
+
+
+class TestEmitSnapshot(unittest.TestCase):
+    """Listeners removed while an `emit` is in flight are still called by that `emit`, like node; removing them again
+    must not raise.
+
+    """
+    def test_remove_once_listener_during_emit(self):
+        emitter = EventEmitter()
+        calls = []
+
+        def first():
+            calls.append('first')
+            emitter.removeListener('a', wrapper)
+
+        emitter.on('a', first)
+        emitter.on('a', lambda: calls.append('second'))
+        emitter.once('a', lambda: calls.append('once'))
+        wrapper = emitter.listeners('a')[2]
+
+        emitter.emit('a')
+        emitter.emit('a')
+
+        self.assertEqual(calls, ['first', 'second', 'once', 'first', 'second'])
+
+    def test_remove_all_listeners_during_emit(self):
+        emitter = EventEmitter()
+        calls = []
+
+        def reset():
+            calls.append('reset')
+            emitter.removeAllListeners('b')
+            emitter.on('b', lambda: calls.append('new'))
+
+        emitter.once('b', reset)
+        emitter.once('b', lambda: calls.append('once'))
+
+        emitter.emit('b')
+        emitter.emit('b')
+
+        self.assertEqual(calls, ['reset', 'once', 'new'])
+
+    def test_remove_unknown_listener(self):
+        emitter = EventEmitter()
+        emitter.on('a', lambda: None)
+
+        emitter.removeListener('a', lambda: None)
+        self.assertEqual(len(emitter.listeners('a')), 1)
+
+
+class TestEventEmitter(unittest.TestCase):
+    def test_leak_warning(self):
+        emitter = EventEmitter()
+        emitter.setMaxListeners(1)
+
+        with warnLogged() as messages:
+            for _ in range(3):
+                emitter.on('a', lambda: None)
+
+        self.assertEqual(len(messages), 1)
+        self.assertIn('a', emitter._warned)
+
+    def test_once_forwards_arguments(self):
+        emitter = EventEmitter()
+        calls = []
+
+        emitter.once('a', lambda *args, **kwargs: calls.append((args, kwargs)))
+        emitter.emit('a', 1, 2, key='value')
+        emitter.emit('a', 3)
+
+        self.assertEqual(calls, [((1, 2), {'key': 'value'})])
+
+    def test_add_after_remove_all_listeners(self):
+        emitter = EventEmitter()
+        calls = []
+
+        emitter.on('a', lambda: None)
+        emitter.removeAllListeners()
+        emitter.on('a', lambda: calls.append('a'))
+        emitter.emit('a')
+
+        self.assertEqual(calls, ['a'])
+
+    def test_set_max_listeners(self):
+        emitter = EventEmitter()
+
+        self.assertIs(emitter.setMaxListeners(5), emitter)
+        self.assertEqual(emitter._maxListeners, 5)
+        emitter.setMaxListeners(2.5)
+        self.assertEqual(emitter._maxListeners, 2.5)
+
+        for num in (-1, -0.5, float('nan'), 'x', None):
+            self.assertRaises(TypeError, emitter.setMaxListeners, num)
+        self.assertEqual(emitter._maxListeners, 2.5)
+
+    def test_unhandled_error_rethrows(self):
+        emitter = EventEmitter()
+        error = ValueError('boom')
+
+        with self.assertRaises(ValueError) as context:
+            emitter.emit('error', error)
+        self.assertIs(context.exception, error)
+
+        self.assertRaises(RuntimeError, emitter.emit, 'error', 'not an exception')
+        self.assertRaises(RuntimeError, emitter.emit, 'error')
+
+    def test_remove_once_listener_by_original(self):
+        emitter = EventEmitter()
+        removed = []
+
+        def listener():
+            pass
+
+        emitter.on('removeListener', lambda event, fn: removed.append(fn))
+        emitter.once('z', listener)
+        emitter.removeListener('z', listener)
+
+        self.assertEqual(emitter.listeners('z'), [])
+        self.assertEqual(removed, [listener])
+
+    def test_once_reports_original_when_fired(self):
+        emitter = EventEmitter()
+        removed = []
+
+        def listener():
+            pass
+
+        emitter.on('removeListener', lambda event, fn: removed.append(fn))
+        emitter.once('z', listener)
+        emitter.emit('z')
+
+        self.assertEqual(removed, [listener])
+
+    def test_remove_all_listeners_while_notified(self):
+        emitter = EventEmitter()
+        removed = []
+
+        def onC():
+            pass
+
+        def onRemove(event, listener):
+            removed.append(event)
+            if event == 'b':
+                emitter.removeListener('c', onC)
+
+        emitter.on('b', lambda: None)
+        emitter.on('c', onC)
+        emitter.on('removeListener', onRemove)
+
+        emitter.removeAllListeners()
+
+        self.assertEqual(sorted(removed), ['b', 'c'])
+        self.assertEqual(emitter.listeners('b'), [])
+        self.assertEqual(emitter.listeners('c'), [])
+
+    def test_weakref(self):
+        emitter = EventEmitter()
+        self.assertIs(weakref.ref(emitter)(), emitter)
+
+
+if __name__ == '__main__':
+    unittest.main()